@@ -69,8 +69,9 @@ master_doc = 'index'
 # |version| and |release|, also used in various other places throughout the
 # built documents.
 #
-# The short X.Y version.
-version = open("../../VERSION").read().strip()
+# The short X.Y version, as installed from pyproject.toml.
+from importlib.metadata import version as package_version
+version = package_version("oriented_matroids")
 # The full version, including alpha/beta/rc tags.
 release = version
 
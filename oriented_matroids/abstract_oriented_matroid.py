@@ -19,6 +19,7 @@ AUTHORS:
 
 from sage.misc.abstract_method import abstract_method
 from sage.misc.cachefunc import cached_method
+from sage.misc.prandom import choice
 from sage.structure.unique_representation import UniqueRepresentation
 from sage.structure.parent import Parent
 from sage.categories.sets_cat import Sets
@@ -62,6 +63,18 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
                                    ),
                        )
 
+    @staticmethod
+    def __classcall__(cls, data, groundset=None, category=None):
+        """
+        Normalize arguments and set class.
+        """
+        if category is None:
+            category = Sets()
+        return super().__classcall__(cls,
+                                     data=data,
+                                     groundset=groundset,
+                                     category=category)
+
     def __init__(self, category=None):
         if category is None:
             category = Sets()
@@ -118,45 +131,64 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
              -: 0
              0: ]
         """
-        if hasattr(self, "_circuits"):
+        try:
             return self._circuits
-        raise NotImplementedError("Circuits not implemented")
+        except AttributeError:
+            raise NotImplementedError("Circuits not implemented")
 
     def cocircuits(self):
         """
         Return all cocircuits.
         """
-        if hasattr(self, "_cocircuits"):
+        try:
             return self._cocircuits
-        raise NotImplementedError("Cocircuits not implemented")
+        except AttributeError:
+            raise NotImplementedError("Cocircuits not implemented")
 
     def vectors(self):
         """
         Return all vectors.
         """
-        if hasattr(self, "_vectors"):
+        try:
             return self._vectors
-        raise NotImplementedError("Vectors not implemented")
-        pass
+        except AttributeError:
+            raise NotImplementedError("Vectors not implemented")
 
     def covectors(self):
         """
         Return all covectors.
         """
-        if hasattr(self, "_covectors"):
+        try:
             return self._covectors
-        raise NotImplementedError("Covectors not implemented")
+        except AttributeError:
+            raise NotImplementedError("Covectors not implemented")
 
+    def _covectors_iterator(self):
+        r"""
+        Return an iterator over the covectors.
+
+        Methods which may stop at the first matching covector should use this
+        instead of :meth:`covectors`, so that subclasses can generate the
+        covectors on the fly.
+        """
+        yield from self.covectors()
+
+    @cached_method
     def convert_to(self, new_type=None):
         '''
         Return an oriented matroid of type specified.
 
+        The result is cached, so repeated conversions of the same oriented
+        matroid do not rebuild (and revalidate) the new oriented matroid.
+
         EXAMPLES::
 
             sage: from oriented_matroids.oriented_matroid import OrientedMatroid
             sage: M = OrientedMatroid([[1],[-1],[0]], key='vector')
             sage: M.convert_to('circuit')
             Circuit oriented matroid of rank 0
+            sage: M.convert_to('circuit') is M.convert_to('circuit')
+            True
             sage: M.convert_to()
             Traceback (most recent call last):
             ...
@@ -200,7 +232,7 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         """
         pass
 
-    # @cached_method
+    @cached_method
     def rank(self):
         r"""
         Return the rank.
@@ -233,11 +265,53 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
             True
 
         """
-        from sage.misc.prandom import randint
-        els = self.elements()
-        i = randint(1, len(els))
-        return els[i - 1]
+        return choice(self.elements())
+
+    @cached_method
+    def _groundset_bits(self):
+        r"""
+        Return a dictionary sending the `i`-th element of the ground set
+        to `2^i`.
+
+        This is used to encode subsets of the ground set as bitmasks.
+        """
+        return {e: 1 << i for i, e in enumerate(self.groundset() or ())}
+
+    @cached_method
+    def _covector_masks(self):
+        r"""
+        Return the positives and negatives of the covectors as bitmasks.
+
+        The `i`-th bit of a mask is set if the `i`-th element of the ground
+        set belongs to the corresponding set.
 
+        OUTPUT:
+
+        A pair of lists of integers, indexed like :meth:`covectors`.
+        """
+        bit = self._groundset_bits()
+        els = self.covectors()
+        pos = [sum(bit[e] for e in X.positives()) for X in els]
+        neg = [sum(bit[e] for e in X.negatives()) for X in els]
+        return pos, neg
+
+    @cached_method
+    def _face_covers(self):
+        r"""
+        Return the cover relations of the face poset as pairs of indices.
+
+        Both sign masks of a covector are packed into one integer, so that
+        the face order becomes inclusion of the packed masks. The full
+        relation is only needed to find the covers, so it is not kept.
+        """
+        pos, neg = self._covector_masks()
+        # `Y \leq X` if and only if `Y^+ \subseteq X^+` and `Y^- \subseteq X^-`,
+        # so we pack both masks into one and test a single inclusion.
+        shift = len(self.groundset())
+        packed = [p | (n << shift) for p, n in zip(pos, neg)]
+        return _subset_covers(packed, _subset_pairs(packed))
+
+    @cached_method
     def face_poset(self, facade=False):
         r"""
         Return the (big) face poset.
@@ -258,20 +332,16 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         """
         from sage.combinat.posets.lattices import MeetSemilattice
         els = self.covectors()
-        rels = [
-            (Y, X)
-            for X in els
-            for Y in els
-            if Y.is_conformal_with(X) and Y.support().issubset(X.support())
-        ]
-        return MeetSemilattice((els, rels), cover_relations=False, facade=facade)
+        rels = [(els[j], els[i]) for j, i in self._face_covers()]
+        return MeetSemilattice((els, rels), cover_relations=True, facade=facade)
 
+    @cached_method
     def face_lattice(self, facade=False):
         r"""
         Return the (big) face lattice.
 
         The *(big) face lattice* is the (big) face poset with a top element
-        added.
+        added. It is built from the cover relations of :meth:`face_poset`.
 
         EXAMPLES::
 
@@ -284,38 +354,50 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
             Finite lattice containing 14 elements
         """
         from sage.combinat.posets.lattices import LatticePoset
-        els = self.covectors()
-        rels = [
-            (Y, X)
-            for X in els
-            for Y in els
-            if Y.is_conformal_with(X) and Y.support().issubset(X.support())
-        ]
+        P = self.face_poset(facade=True)
+        els = list(P)
+        rels = [tuple(r) for r in P.cover_relations()]
 
         # Add top element
-        for i in els:
-            rels.append((i, 1))
+        rels.extend((X, 1) for X in P.maximal_elements())
         els.append(1)
-        return LatticePoset((els, rels), cover_relations=False, facade=facade)
-
-#             P = self.face_poset()
-#             rels = P.relations()
-#             els = [1]
-#             for i in P:
-#                 els.append(i.element)
-#                 rels.append([i.element, 1])
-#
-#             return LatticePoset((els,rels),
-#                                 cover_relations=False,
-#                                 facade=facade)
+        return LatticePoset((els, rels), cover_relations=True, facade=facade)
 
+    @cached_method
     def topes(self):
         r"""
         Return the topes.
 
         A *tope* is the maximal covector in the face poset.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: set(M.topes()) == set(M.face_poset(facade=True).maximal_elements())
+            True
+            sage: len(M.topes())
+            6
         """
-        return self.face_poset(facade=True).maximal_elements()
+        return list(self._topes_iterator())
+
+    def _topes_iterator(self):
+        r"""
+        Iterate over the topes, in the order of :meth:`covectors`.
+
+        All topes have the same support, which is the union of the supports
+        of all covectors, so the topes are the covectors with that support.
+        This needs the support of every covector before the first tope is
+        returned, but it does not build the face poset.
+        """
+        sup = [p | n for p, n in zip(*self._covector_masks())]
+        top = 0
+        for S in sup:
+            top |= S
+        for X, S in zip(self._covectors_iterator(), sup):
+            if S == top:
+                yield X
 
     def tope_poset(self, base_tope, facade=False):
         r"""
@@ -326,17 +408,31 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         *base tope*. The order is given by inclusion of separation sets
         from the base tope: `X \leq Y` if and only if
         `S(B, X) \subseteq S(B, Y)`.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: B = M.topes()[0]
+            sage: P = M.tope_poset(B, facade=True); P
+            Finite poset containing 6 elements
+            sage: P.rank()
+            3
+            sage: Q = Poset((M.topes(), lambda X, Y:
+            ....:     B.separation_set(X).issubset(B.separation_set(Y))),
+            ....:     facade=True)
+            sage: P.hasse_diagram() == Q.hasse_diagram()
+            True
         """
         from sage.combinat.posets.posets import Poset
         els = self.topes()
-        rels = [
-            (X, Y)
-            for X in els
-            for Y in els
-            if base_tope.separation_set(X).issubset(base_tope.separation_set(Y))
-        ]
+        bit = self._groundset_bits()
+        seps = [sum(bit[e] for e in base_tope.separation_set(X)) for X in els]
+        covers = _subset_covers(seps, _subset_pairs(seps))
+        rels = [(els[j], els[i]) for j, i in covers]
 
-        return Poset((els, rels), cover_relations=False, facade=facade)
+        return Poset((els, rels), cover_relations=True, facade=facade)
 
     def is_simplicial(self):
         r"""
@@ -347,11 +443,16 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         .. SEEALSO::
 
             :meth:`~sage.matroids.oriented_matroids.signed_subset_element.SignedSubsetElement.is_simplicial`
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: M.is_simplicial()
+            True
         """
-        for t in self.topes():
-            if not t.is_simplicial():
-                return False
-        return True
+        return all(t.is_simplicial() for t in self._topes_iterator())
 
     def is_acyclic(self):
         r"""
@@ -360,11 +461,19 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         A covector oriented matroid is *acyclic* if there exists a positive
         tope where a *positive tope* is defined as a tope with no
         negative part.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: M.is_acyclic()
+            True
+            sage: M = OrientedMatroid([[0,0],[1,-1],[-1,1]], key='covector')
+            sage: M.is_acyclic()
+            False
         """
-        for t in self.topes():
-            if len(t.negatives()) == 0:
-                return True
-        return False
+        return any(not t.negatives() for t in self._topes_iterator())
 
     def deletion(self, change_set):
         r"""
@@ -382,23 +491,26 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         EXAMPLES::
 
             sage: from oriented_matroids.oriented_matroid import OrientedMatroid
-
+            sage: C = [ [1,1,1], [1,1,0],[1,1,-1],[1,0,-1],[1,-1,-1],[0,-1,-1],
+            ....: [-1,-1,-1],[0,1,1],[-1,1,1],[-1,0,1],[-1,-1,1],[-1,-1,0],
+            ....: [0,0,0]]
+            sage: M = OrientedMatroid(C, key='covector')
+            sage: D = M.deletion(0); D
+            Covector oriented matroid of rank 2
+            sage: D.groundset()
+            (1, 2)
+            sage: len(D.covectors())
+            9
         """
         if change_set in self.groundset():
-            change_set = set([change_set])
+            change_set = frozenset([change_set])
         else:
-            change_set = set(change_set)
-
-        from oriented_matroids.oriented_matroid import deep_tupler
-        groundset = set(self.groundset()).difference(change_set)
-        groundset = deep_tupler(groundset)
-        data = []
-        for c in self.covectors():
-            p = tuple(c.positives().difference(change_set))
-            n = tuple(c.negatives().difference(change_set))
-            z = tuple(c.zeroes().difference(change_set))
-            data.append((p, n, z))
-        data = deep_tupler(data)
+            change_set = frozenset(change_set)
+
+        groundset = tuple(e for e in self.groundset() if e not in change_set)
+        # Distinct covectors may agree outside ``change_set``
+        data = tuple(dict.fromkeys(_signs_outside(c, change_set)
+                                   for c in self.covectors()))
 
         from oriented_matroids.oriented_matroid import OrientedMatroid
         return OrientedMatroid(data, key='covector', groundset=groundset)
@@ -416,31 +528,29 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
 
             \mathcal{C} / A = \left\{ X\mid_{E \backslash A} : X \in \mathcal{C} \text{ and} A \subseteq X^0 \right\}
 
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: C = [ [1,1,1], [1,1,0],[1,1,-1],[1,0,-1],[1,-1,-1],[0,-1,-1],
+            ....: [-1,-1,-1],[0,1,1],[-1,1,1],[-1,0,1],[-1,-1,1],[-1,-1,0],
+            ....: [0,0,0]]
+            sage: M = OrientedMatroid(C, key='covector')
+            sage: R = M.restriction(0); R
+            Covector oriented matroid of rank 1
+            sage: R.groundset()
+            (1, 2)
+            sage: len(R.covectors())
+            3
         """
-        # sage: from oriented_matroids import OrientedMatroid
-        # sage: A = hyperplane_arrangements.braid(3)
-        # sage: M = OrientedMatroid(A); M
-        # Covector Oriented Matroid of rank 3
-        # sage: R = M.restriction(M.groundset()[1]); R
-        # Covector Oriented Matroid of rank 2
-        # sage: R.elements()
-        # [(0,0), (1,1), (-1,-1)]
         if change_set in self.groundset():
-            change_set = set([change_set])
+            change_set = frozenset([change_set])
         else:
-            change_set = set(change_set)
-
-        from oriented_matroids.oriented_matroid import deep_tupler
-        groundset = set(self.groundset()).difference(change_set)
-        groundset = deep_tupler(groundset)
-        data = []
-        for c in self.covectors():
-            p = tuple(c.positives().difference(change_set))
-            n = tuple(c.negatives().difference(change_set))
-            z = tuple(c.zeroes().difference(change_set))
-            if change_set.issubset(c.zeroes()):
-                data.append((p, n, z))
-        data = deep_tupler(data)
+            change_set = frozenset(change_set)
+
+        groundset = tuple(e for e in self.groundset() if e not in change_set)
+        data = tuple(dict.fromkeys(_signs_outside(c, change_set)
+                                   for c in self.covectors()
+                                   if change_set.issubset(c.zeroes())))
 
         from oriented_matroids.oriented_matroid import OrientedMatroid
         return OrientedMatroid(data, key='covector', groundset=groundset)
@@ -453,14 +563,30 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         tope `T \in \mathcal{T}` with `T(e) = 0`. In particular
         if `T(e) = 0` for some `T`, then it is true for all
         `T \in \mathcal{T}`.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: M = OrientedMatroid([[0,0],[1,0],[-1,0]], key='covector')
+            sage: M.loops()
+            [1]
+            sage: C = [ [1,1,1], [1,1,0],[1,1,-1],[1,0,-1],[1,-1,-1],[0,-1,-1],
+            ....: [-1,-1,-1],[0,1,1],[-1,1,1],[-1,0,1],[-1,-1,1],[-1,-1,0],
+            ....: [0,0,0]]
+            sage: M = OrientedMatroid(C, key='covector')
+            sage: M.loops()
+            []
+        """
+        Z = self.topes()[0].zeroes()
+        return [e for e in self.groundset() if e in Z]
+
+    def _has_loop(self):
+        r"""
+        Return whether the oriented matroid has a loop.
+
+        Unlike :meth:`loops`, this does not build the list of loops.
         """
-        T = self.topes()[0]
-        loops = []
-        gs = self.groundset()
-        for i, j in enumerate(T):
-            if T(j) == 0:
-                loops.append(gs[i])
-        return loops
+        return len(self.topes()[0].zeroes()) > 0
 
     def are_parallel(self, e, f):
         r"""
@@ -469,15 +595,38 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
         Two elements in the ground set `e, f \in E` are parallel if they
         are not loops and for all `X \in \mathcal{C}`, `X(e) = 0`
         implies `X(f) = 0`. See Lemma 4.1.10 [BLSWZ1999]_ .
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: M = OrientedMatroid([[0,0],[1,1],[-1,-1]], key='covector')
+            sage: M.are_parallel(0, 1)
+            True
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: E = M.groundset()
+            sage: M.are_parallel(E[0], E[1])
+            False
         """
-        gs = set(self.groundset()).difference(set(self.loops()))
+        gs = self._non_loop_set()
         if e not in gs or f not in gs:
             raise ValueError(
                 "Elements must be in groundset and must not be loops")
-        for i in self.elements():
-            if i(e) == 0 and i(f) != 0:
-                return False
-        return True
+        return not any(e in Z and f not in Z for Z in self._zero_sets())
+
+    @cached_method
+    def _zero_sets(self):
+        r"""
+        Return the zero sets of the elements as frozensets.
+        """
+        return [frozenset(X.zeroes()) for X in self.elements()]
+
+    @cached_method
+    def _non_loop_set(self):
+        r"""
+        Return the elements of the ground set which are not loops.
+        """
+        return frozenset(self.groundset()).difference(self.loops())
 
     def is_simple(self):
         r"""
@@ -485,22 +634,122 @@ class AbstractOrientedMatroid(UniqueRepresentation, Parent):
 
         An oriented matroid is *simple* if there are no loops
         and no parallel elements.
+
+        Parallel elements are exactly the elements which are zero on the
+        same elements of the oriented matroid, so we record for every
+        element of the ground set the elements on which it is zero and
+        check that these patterns are distinct.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: OrientedMatroid(A).is_simple()
+            True
+
+        Parallel elements or loops make an oriented matroid not simple::
+
+            sage: M = OrientedMatroid([[0,0],[1,1],[-1,-1]], key='covector')
+            sage: M.is_simple()
+            False
+            sage: M = OrientedMatroid([[0,0],[1,0],[-1,0]], key='covector')
+            sage: M.is_simple()
+            False
         """
-        from sage.combinat.subset import Subsets
-        if len(self.loops()) > 0:
+        if self._has_loop():
             return False
-        for i in Subsets(self.groundset(), 2):
-            if self.are_parallel(i[0], i[1]):
-                return False
-        return True
+        sig = dict.fromkeys(self._non_loop_set(), 0)
+        for k, Z in enumerate(self._zero_sets()):
+            bit = 1 << k
+            for e in Z:
+                if e in sig:
+                    sig[e] |= bit
+        return len(set(sig.values())) == len(sig)
 
     def _element_constructor_(self, x):
         r"""
         Determine if ``x`` may be viewed as belonging to ``self``.
         """
         try:
-            if x in self.elements():
+            if x in self._elements_set():
                 return x
             return False
-        except ValueError:
+        except (ValueError, TypeError):
             return False
+
+    @cached_method
+    def _elements_set(self):
+        r"""
+        Return the elements of ``self`` as a frozenset, for membership tests.
+        """
+        return frozenset(self.elements())
+
+
+def _subset_pairs(masks):
+    r"""
+    Return all pairs ``(j, i)`` such that ``masks[j]`` is a submask of
+    ``masks[i]``.
+
+    INPUT:
+
+    - ``masks`` -- a list of integers used as bitsets
+    """
+    rels = []
+    extend = rels.extend
+    for i, X in enumerate(masks):
+        Xc = ~X
+        extend((j, i) for j, Y in enumerate(masks) if not Y & Xc)
+    return rels
+
+
+def _subset_covers(masks, pairs):
+    r"""
+    Return the pairs ``(j, i)`` from ``pairs`` such that ``masks[j]`` is
+    covered by ``masks[i]`` under inclusion.
+
+    The masks below ``masks[i]`` are swept by decreasing size. Every mask
+    strictly between ``masks[j]`` and ``masks[i]`` is larger than
+    ``masks[j]``, so ``masks[j]`` is covered by ``masks[i]`` if and only if
+    it is not below one of the covers of ``masks[i]`` found before it.
+
+    INPUT:
+
+    - ``masks`` -- a list of distinct integers used as bitsets
+    - ``pairs`` -- all pairs ``(j, i)`` such that ``masks[j]`` is a submask
+      of ``masks[i]``, as returned by :func:`_subset_pairs`
+    """
+    size = [bin(X).count('1') for X in masks]
+    below = [[] for _ in masks]
+    for j, i in pairs:
+        if j != i:
+            below[i].append(j)
+
+    covers = []
+    for i, B in enumerate(below):
+        B.sort(key=size.__getitem__, reverse=True)
+        found = []
+        for j in B:
+            Y = masks[j]
+            if any(not Y & ~masks[k] for k in found):
+                continue
+            found.append(j)
+            covers.append((j, i))
+    return covers
+
+
+def _signs_outside(X, change_set):
+    r"""
+    Return the positives, negatives and zeroes of ``X`` which are not in
+    ``change_set``.
+
+    Each part is filtered in a single pass without building intermediate
+    sets.
+
+    OUTPUT:
+
+    A triple of frozensets, so that equal restrictions compare and hash
+    equal.
+    """
+    return (frozenset(e for e in X.positives() if e not in change_set),
+            frozenset(e for e in X.negatives() if e not in change_set),
+            frozenset(e for e in X.zeroes() if e not in change_set))
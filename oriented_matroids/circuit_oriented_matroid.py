@@ -20,7 +20,7 @@ AUTHORS:
 ##############################################################################
 
 from oriented_matroids.abstract_oriented_matroid import AbstractOrientedMatroid
-from sage.categories.sets_cat import Sets
+from sage.misc.cachefunc import cached_method
 
 
 class CircuitOrientedMatroid(AbstractOrientedMatroid):
@@ -69,21 +69,9 @@ class CircuitOrientedMatroid(AbstractOrientedMatroid):
     .. SEEALSO::
 
         :class:`oriented_matroids.oriented_matroid.OrientedMatroid`
-        :class:`oriented_matroids.oriented_matroids_category.OrientedMatroids`
+        :class:`oriented_matroids.abstract_oriented_matroid.AbstractOrientedMatroid`
     """
 
-    @staticmethod
-    def __classcall__(cls, data, groundset=None, category=None):
-        """
-        Normalize arguments and set class.
-        """
-        if category is None:
-            category = Sets()
-        return super().__classcall__(cls,
-                                     data=data,
-                                     groundset=groundset,
-                                     category=category)
-
     def __init__(self, data, groundset=None, category=None):
         """
         Initialize ``self``.
@@ -157,35 +145,43 @@ class CircuitOrientedMatroid(AbstractOrientedMatroid):
 
         """
         circuits = self.circuits()
-
-        for X in circuits:
+        bit = self._groundset_bits()
+        pos = [sum(bit[e] for e in X.positives()) for X in circuits]
+        neg = [sum(bit[e] for e in X.negatives()) for X in circuits]
+        signs = set(zip(pos, neg))
+        everything = range(len(circuits))
+
+        for i in everything:
+            Xp = pos[i]
+            Xn = neg[i]
+            Xs = Xp | Xn
             # Axiom 1: Make sure empty is not present
-            if X.is_zero():
+            if not Xs:
                 raise ValueError("Empty set not allowed")
             # Axiom 2: (symmetry) Make sure negative exists
-            if -X not in circuits:
+            if (Xn, Xp) not in signs:
                 raise ValueError("Every element needs an opposite")
-            for Y in circuits:
+            for j in everything:
+                Yp = pos[j]
+                Yn = neg[j]
+                opposite = Xp == Yn and Xn == Yp
                 # Axiom 3: (incomparability) supports must not be contained
-                if X.support().issubset(Y.support()):
-                    if X != Y and X != -Y:
+                if not Xs & ~(Yp | Yn):
+                    if (Xp != Yp or Xn != Yn) and not opposite:
                         raise ValueError(
                             "Only same/opposites can have same support")
                 # Axiom 4: Weak elimination
-                if X != -Y:
-                    E = X.positives().intersection(Y.negatives())
-                    for e in E:
-                        p = X.positives().union(Y.positives())
-                        p.discard(e)
-                        n = X.negatives().union(Y.negatives())
-                        n.discard(e)
-                        found = False
-                        for Z in circuits:
-                            if found:
-                                break
-                            if Z.positives().issubset(p) and Z.negatives().issubset(n):
-                                found = True
-                        if not found:
+                if not opposite:
+                    E = Xp & Yn
+                    p_base = Xp | Yp
+                    n_base = Xn | Yn
+                    while E:
+                        e = E & -E
+                        E ^= e
+                        p = p_base & ~e
+                        n = n_base & ~e
+                        if not any(not ((pos[k] & ~p) | (neg[k] & ~n))
+                                   for k in everything):
                             raise ValueError("Weak elimination failed")
 
         return True
@@ -208,6 +204,7 @@ class CircuitOrientedMatroid(AbstractOrientedMatroid):
             rep = "Circuit oriented matroid"
         return rep
 
+    @cached_method
     def matroid(self):
         r"""
         Return the underlying matroid.
@@ -227,5 +224,5 @@ class CircuitOrientedMatroid(AbstractOrientedMatroid):
 
         """
         from sage.matroids.constructor import Matroid
-        circs = list(set([frozenset(X.support()) for X in self.elements()]))
+        circs = list({X._support_frozenset() for X in self.elements()})
         return Matroid(groundset=self.groundset(), circuits=circs)
@@ -20,7 +20,7 @@ AUTHORS:
 ##############################################################################
 
 from oriented_matroids.abstract_oriented_matroid import AbstractOrientedMatroid
-from sage.categories.sets_cat import Sets
+from sage.misc.cachefunc import cached_method
 
 
 class CovectorOrientedMatroid(AbstractOrientedMatroid):
@@ -76,16 +76,6 @@ class CovectorOrientedMatroid(AbstractOrientedMatroid):
         :class:`oriented_matroids.abstract_oriented_matroid.AbstractOrientedMatroid`
     """
 
-    @staticmethod
-    def __classcall__(cls, data, groundset=None, category=None):
-        """
-        Normalize arguments and set class.
-        """
-        if category is None:
-            category = Sets()
-        return super().__classcall__(cls, data, groundset=groundset,
-                                     category=category)
-
     def __init__(self, data, groundset=None, category=None):
         """
         Initialize ``self``
@@ -155,35 +145,44 @@ class CovectorOrientedMatroid(AbstractOrientedMatroid):
             ...
             ValueError: weak elimination failed
         """
-        covectors = self.covectors()
+        pos, neg = self._covector_masks()
+        signs = set(zip(pos, neg))
+        everything = range(len(pos))
+        full = sum(self._groundset_bits().values())
 
         zero_found = False
-        for X in covectors:
+        for i in everything:
+            Xp = pos[i]
+            Xn = neg[i]
+            Xs = Xp | Xn
             # Axiom 1: Make sure empty is not present
-            if X.is_zero():
+            if not Xs:
                 zero_found = True
             # Axiom 2: Make sure negative exists
-            if -X not in covectors:
+            if (Xn, Xp) not in signs:
                 raise ValueError("Every element needs an opposite")
-            for Y in covectors:
+            for j in everything:
+                Yp = pos[j]
+                Yn = neg[j]
                 # Axiom 3: Closed under composition
-                if X.composition(Y) not in covectors:
+                xyp = Xp | (Yp & ~Xs)
+                xyn = Xn | (Yn & ~Xs)
+                # Skip the lookup when `X \circ Y` is `X` or `Y`
+                if Xs and (Yp | Yn) & ~Xs and (xyp, xyn) not in signs:
                     raise ValueError("Composition must be in vectors")
                 # Axiom 4: Weak elimination axiom
-                E = X.separation_set(Y)
-                ze = set(self.groundset()).difference(E)
-                xy = X.composition(Y)
-                for e in E:
-                    found = False
-                    for Z in covectors:
-                        if found:
-                            break
-                        if Z(e) == 0:
-                            found = True
-                            for f in ze:
-                                if Z(f) != xy(f):
-                                    found = False
-                    if not found:
+                E = (Xp & Yn) | (Xn & Yp)
+                if not E:
+                    continue
+                ze = full & ~E
+                zp = xyp & ze
+                zn = xyn & ze
+                while E:
+                    e = E & -E
+                    E ^= e
+                    if not any(not (pos[k] | neg[k]) & e
+                               and pos[k] & ze == zp and neg[k] & ze == zn
+                               for k in everything):
                         raise ValueError("weak elimination failed")
 
         if not zero_found:
@@ -191,6 +190,7 @@ class CovectorOrientedMatroid(AbstractOrientedMatroid):
 
         return True
 
+    @cached_method
     def matroid(self):
         r"""
         Returns the underlying matroid.
@@ -218,6 +218,6 @@ class CovectorOrientedMatroid(AbstractOrientedMatroid):
         """
         from sage.matroids.constructor import Matroid
         from sage.combinat.posets.posets import Poset
-        flats = list(set([frozenset(X.zeroes()) for X in self.elements()]))
+        flats = list({frozenset(X.zeroes()) for X in self.elements()})
         rf = Poset((flats, lambda a, b: a.issubset(b))).rank_function()
         return Matroid(groundset=self.groundset(), rank_function=rf)
@@ -55,9 +55,18 @@ from sage.geometry.triangulation.point_configuration \
 from sage.graphs.digraph import DiGraph
 from sage.structure.element import Matrix
 from oriented_matroids.abstract_oriented_matroid import AbstractOrientedMatroid
+from collections import namedtuple
 import copy
 
 
+# Edge label used when building circuits from a digraph. The sign records
+# whether the edge is an original edge (1) or an added reverse edge (-1).
+SignedLabel = namedtuple('SignedLabel', 'sign label')
+
+# Containers which are converted to tuples by :func:`deep_tupler`.
+_CONTAINERS = (list, set, tuple, frozenset)
+
+
 def OrientedMatroid(data=None, groundset=None, key=None, **kwds):
     r"""
     Construct an oriented matroid.
@@ -197,24 +206,11 @@ def OrientedMatroid(data=None, groundset=None, key=None, **kwds):
 
         # Add minus edges to properly get cycles
         for e in edges:
-            digraph.add_edge(e[1], e[0], "NEG_" + str(e[2]))
+            digraph.set_edge_label(e[0], e[1], SignedLabel(1, e[2]))
+            digraph.add_edge(e[1], e[0], SignedLabel(-1, e[2]))
             groundset.append(str(e[2]))
-        # Each cycle defines a circuit
-        data = []
-        for c in digraph.all_cycles_iterator(simple=True):
-            p = set([])
-            n = set([])
-            for e in range(len(c) - 1):
-                e = str(digraph.edge_label(c[e], c[e + 1]))
-                if e.startswith('NEG_'):
-                    n.add(e.strip('NEG_'))
-                else:
-                    p.add(e)
-            # If an edge exists in both sets, then this is a false cycle.
-            # This implies we have ee^-1 which is why it's false.
-            # So we only add the true ones.
-            if len(p.intersection(n)) == 0:
-                data.append([p, n])
+        # Each cycle defines a circuit.
+        data = _digraph_circuits(digraph)
     elif isinstance(data, Matrix):
         if key != 'chirotope' and key is not None:
             raise ValueError(
@@ -269,8 +265,39 @@ def OrientedMatroid(data=None, groundset=None, key=None, **kwds):
 
 def deep_tupler(obj):
     r"""
-    changes a (nested) list or set into a (nested) tuple to be hashable
+    changes a (nested) list, set or tuple into a (nested) tuple to be hashable
+
+    EXAMPLES::
+
+        sage: from oriented_matroids.oriented_matroid import deep_tupler
+        sage: deep_tupler([[1, 2], ([3], 4)])
+        ((1, 2), ((3,), 4))
     """
-    if isinstance(obj, list) or isinstance(obj, set):
-        return tuple([deep_tupler(i) for i in obj])
+    if isinstance(obj, _CONTAINERS):
+        return tuple(deep_tupler(i) for i in obj)
     return obj
+
+
+def _digraph_circuits(digraph):
+    r"""
+    Return the circuits given by the simple cycles of a digraph.
+
+    The edges of ``digraph`` must be labelled by :class:`SignedLabel`.
+    """
+    data = []
+    edge_label = digraph.edge_label
+    for c in digraph.all_cycles_iterator(simple=True):
+        p = set([])
+        n = set([])
+        for i in range(len(c) - 1):
+            lab = edge_label(c[i], c[i + 1])
+            if lab.sign < 0:
+                n.add(str(lab.label))
+            else:
+                p.add(str(lab.label))
+        # If an edge exists in both sets, then this is a false cycle.
+        # This implies we have ee^-1 which is why it's false.
+        # So we only add the true ones.
+        if len(p.intersection(n)) == 0:
+            data.append([p, n])
+    return data
@@ -18,8 +18,10 @@ AUTHORS:
 #
 #                  http://www.gnu.org/licenses/
 ##############################################################################
+from oriented_matroids.abstract_oriented_matroid import AbstractOrientedMatroid
 from oriented_matroids.covector_oriented_matroid import CovectorOrientedMatroid
-from sage.categories.sets_cat import Sets
+from sage.misc.cachefunc import cached_method
+from sage.misc.lazy_attribute import lazy_attribute
 
 
 class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
@@ -29,6 +31,10 @@ class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
     This implements an oriented matroid using hyperplane arrangements.
     Oriented matroids arise from central hyperplane arrangements.
 
+    The covectors are the sign vectors of the closed faces of the
+    arrangement. The face poset and face lattice are computed from these
+    sign vectors alone, without testing polyhedra for containment.
+
     INPUT:
 
     - ``data`` -- a :class:`HyperplaneArrangementElement` element.
@@ -42,6 +48,10 @@ class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
         sage: A = hyperplane_arrangements.braid(3)
         sage: M = OrientedMatroid(A); M
         Hyperplane arrangement oriented matroid of rank 2
+        sage: M.face_poset()
+        Finite meet-semilattice containing 13 elements
+        sage: M.face_lattice()
+        Finite lattice containing 14 elements
         sage: A = hyperplane_arrangements.braid(5)
         sage: M = OrientedMatroid(A); M
         Hyperplane arrangement oriented matroid of rank 4
@@ -63,32 +73,139 @@ class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
         :class:`sage.geometry.hyperplane_arrangement.arrangement.HyperplaneArrangementElement`
     """
 
-    @staticmethod
-    def __classcall__(cls, data, groundset=None, category=None):
-        """
-        Normalize arguments and set class.
-        """
-        if category is None:
-            category = Sets()
-        return super().__classcall__(cls,
-                                     data=data,
-                                     groundset=groundset,
-                                     category=category)
-
     def __init__(self, data, groundset=None, category=None):
         """
         Initialize ``self``
         """
 
+        AbstractOrientedMatroid.__init__(self, category=category)
         self._arrangement = data
 
         if data and groundset is None:
             groundset = tuple(data.hyperplanes())
 
-        # Set up our covectors after our groundset is made
-        faces = [i[0] for i in self._arrangement.closed_faces()]
+        if groundset is None:
+            self._groundset = groundset
+        else:
+            self._groundset = tuple(groundset)
+
+        # The covectors are only built when they are first asked for
 
-        CovectorOrientedMatroid.__init__(self, data=faces, groundset=groundset, category=category)
+    @cached_method
+    def _closed_faces(self, labelled=True):
+        """
+        Return the closed faces of the arrangement.
+
+        This caches :meth:`~sage.geometry.hyperplane_arrangement.arrangement.HyperplaneArrangementElement.closed_faces`
+        as enumerating the faces is the expensive part of working with a
+        hyperplane arrangement.
+        """
+        return self._arrangement.closed_faces(labelled=labelled)
+
+    @lazy_attribute
+    def _sign_vectors(self):
+        """
+        The sign vectors of the closed faces of the arrangement.
+
+        These are stored as plain tuples, in the same order as
+        :meth:`covectors`.
+        """
+        return tuple(tuple(f[0]) for f in self._closed_faces())
+
+    @lazy_attribute
+    def _covectors(self):
+        """
+        The covectors of ``self``, one for each closed face.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids import OrientedMatroid
+            sage: A = hyperplane_arrangements.coordinate(2)
+            sage: M = OrientedMatroid(A)
+            sage: '_covectors' in M.__dict__
+            False
+            sage: len(M.covectors())
+            9
+        """
+        return self.element_class._from_sign_vectors(self, self._sign_vectors,
+                                                     self._groundset)
+
+    @lazy_attribute
+    def _elements(self):
+        """
+        The elements of ``self``, which are its covectors.
+        """
+        return self._covectors
+
+    @cached_method
+    def _covector_masks(self):
+        """
+        Return the positives and negatives of the covectors as bitmasks.
+
+        The masks are read off the sign vectors of the faces directly
+        instead of going through the covector elements.
+        """
+        pos = []
+        neg = []
+        for f in self._sign_vectors:
+            p = 0
+            n = 0
+            for i, x in enumerate(f):
+                if x > 0:
+                    p |= 1 << i
+                elif x < 0:
+                    n |= 1 << i
+            pos.append(p)
+            neg.append(n)
+        return pos, neg
+
+    @lazy_attribute
+    def _normals(self):
+        """
+        The normal vectors of the hyperplanes, as the rows of a matrix.
+
+        The rows follow the order of the hyperplanes of the arrangement, so
+        the `i`-th row belongs to the `i`-th element of :meth:`groundset`.
+        """
+        from sage.matrix.constructor import matrix
+        A = self.arrangement()
+        return matrix(A.base_ring(), [H.normal() for H in A.hyperplanes()])
+
+    @cached_method
+    def matroid(self):
+        r"""
+        Returns the underlying matroid.
+
+        The rank of a set of hyperplanes is the rank of their normal
+        vectors, so the matroid is read off the arrangement without
+        enumerating any faces.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids import OrientedMatroid
+            sage: A = hyperplane_arrangements.coordinate(3)
+            sage: M = OrientedMatroid(A)
+            sage: M.matroid()
+            Matroid of rank 3 on 3 elements
+            sage: '_covectors' in M.__dict__
+            False
+
+        The ground set may be given by labels other than the hyperplanes::
+
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A, groundset=['a','b','c'])
+            sage: M.matroid()
+            Matroid of rank 2 on 3 elements
+            sage: M.rank()
+            2
+        """
+        from sage.matroids.constructor import Matroid
+        normals = self._normals
+        index = {e: i for i, e in enumerate(self.groundset())}
+
+        def rf(X):
+            return normals.matrix_from_rows([index[e] for e in X]).rank()
+        return Matroid(groundset=self.groundset(), rank_function=rf)
 
     def _repr_(self) -> str:
         """
@@ -101,11 +218,18 @@ class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
             rep = "Hyperplane arrangement oriented matroid"
         return rep
 
+    @cached_method
+    def _is_central(self):
+        """
+        Return whether the arrangement is central.
+        """
+        return self._arrangement.is_central()
+
     def is_valid(self) -> bool:
         """
         Return whether or not the arrangement is an oriented matroid
         """
-        if not self.arrangement().is_central():
+        if not self._is_central():
             raise ValueError("Hyperplane arrangements must be central to be an oriented matroid.")
 
         return True
@@ -141,12 +265,50 @@ class RealHyperplaneArrangementOrientedMatroid(CovectorOrientedMatroid):
             Hyperplane arrangement oriented matroid of rank 7
             sage: M2 = M.deletion(H); M2
             Hyperplane arrangement oriented matroid of rank 6
+            sage: M.deletion(H[0]) == M.deletion([H[0]])
+            True
+            sage: M.deletion(set(H)) == M2
+            True
+            sage: M.deletion([]) is M
+            True
+
+        Once the faces of ``self`` are known, they are restricted to give
+        the faces of the deletion. They agree with the faces computed from
+        the smaller arrangement, although they are listed in sorted order::
+
+            sage: A = hyperplane_arrangements.braid(4)
+            sage: M = OrientedMatroid(A)
+            sage: len(M.covectors())
+            75
+            sage: M2 = M.deletion(A.hyperplanes()[0])
+            sage: faces = M2.arrangement().closed_faces()
+            sage: set(M2._sign_vectors) == set(tuple(f[0]) for f in faces)
+            True
+            sage: list(M2._sign_vectors) == sorted(M2._sign_vectors)
+            True
 
         """
         A = self.arrangement()
-        if isinstance(hyperplanes, list) or isinstance(hyperplanes, tuple):
-            for h in hyperplanes:
-                A = A.deletion(h)
+        if isinstance(hyperplanes, (list, tuple, set, frozenset)):
+            to_delete = frozenset(hyperplanes)
         else:
-            A = A.deletion(h)
-        return RealHyperplaneArrangementOrientedMatroid(A)
+            to_delete = frozenset([hyperplanes])
+        if not to_delete.issubset(A.hyperplanes()):
+            raise ValueError("hyperplane is not in the arrangement")
+        if not to_delete:
+            return self
+
+        # Rebuild the arrangement once instead of once per hyperplane
+        kept = [h for h in A.hyperplanes() if h not in to_delete]
+        M = RealHyperplaneArrangementOrientedMatroid(A.parent()(*kept))
+
+        # If our faces are known, the faces of the deletion are their
+        # restrictions to the kept hyperplanes; no geometry is needed.
+        # They are sorted so that their order does not depend on ours.
+        if '_sign_vectors' in self.__dict__ \
+                and '_sign_vectors' not in M.__dict__:
+            index = {h: i for i, h in enumerate(A.hyperplanes())}
+            keep = [index[h] for h in M.arrangement().hyperplanes()]
+            M._sign_vectors = tuple(sorted(set(
+                tuple(f[i] for i in keep) for f in self._sign_vectors)))
+        return M
@@ -182,6 +182,7 @@ class SignedSubsetElement(Element):
         self._p = set(self._p)
         self._n = set(self._n)
         self._z = set(self._z)
+        self._s = frozenset(self._p.union(self._n))
 
         # Setup the ground set if it's not set yet
         if groundset is None:
@@ -204,6 +205,44 @@ class SignedSubsetElement(Element):
 
         Element.__init__(self, parent)
 
+    @classmethod
+    def _from_sign_vectors(cls, parent, data, groundset):
+        r"""
+        Return a list of elements, one for each sign vector in ``data``.
+
+        This skips the input parsing and checks done by ``__init__``: each
+        sign vector must be a sequence of `-1`, `0` and `1` with one entry
+        per element of ``groundset``. All the elements share the same
+        ground set.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: M = OrientedMatroid([[1,0],[-1,0],[0,0]], key='covector')
+            sage: E = M.element_class._from_sign_vectors(M, [(1,0),(0,-1)], M.groundset())
+            sage: E == [M.element_class(M, data=(1,0)), M.element_class(M, data=(0,-1))]
+            True
+        """
+        gs = list(groundset)
+        out = []
+        for d in data:
+            X = cls.__new__(cls)
+            X._p = set()
+            X._n = set()
+            X._z = set()
+            for e, x in zip(gs, d):
+                if x > 0:
+                    X._p.add(e)
+                elif x < 0:
+                    X._n.add(e)
+                else:
+                    X._z.add(e)
+            X._s = frozenset(X._p.union(X._n))
+            X._g = gs
+            Element.__init__(X, parent)
+            out.append(X)
+        return out
+
     def __call__(self, var):
         """
         Return the sign of an element in the groundset.
@@ -272,7 +311,7 @@ class SignedSubsetElement(Element):
         `\emptyset = (\emptyset,\emptyset)` to be a zero as
         it is the same as the all zero vector.
         """
-        if len(self.support()) > 0:
+        if len(self._s) > 0:
             return True
         return False
 
@@ -420,7 +459,16 @@ class SignedSubsetElement(Element):
             {0, 1}
 
         """
-        return self._p.union(self._n)
+        return set(self._s)
+
+    def _support_frozenset(self):
+        r"""
+        Return the support set as a frozenset.
+
+        The frozenset is computed once when the element is built, so it can
+        be hashed and compared without building a new set.
+        """
+        return self._s
 
     def groundset(self):
         r"""
@@ -549,8 +597,16 @@ class SignedSubsetElement(Element):
 
             Requires the method `face_lattice` to exist in the oriented
             matroid.
+
+        EXAMPLES::
+
+            sage: from oriented_matroids.oriented_matroid import OrientedMatroid
+            sage: A = hyperplane_arrangements.braid(3)
+            sage: M = OrientedMatroid(A)
+            sage: [X.is_tope() for X in M.covectors()].count(True)
+            6
         """
-        if getattr(self.parent(), 'face_lattice', None) is not None:
+        if getattr(self.parent(), 'face_lattice', None) is None:
             raise TypeError(
                 "Topes are only implemented if .face_lattice() is implemented")
 
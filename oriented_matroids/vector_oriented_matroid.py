@@ -20,7 +20,8 @@ AUTHORS:
 ##############################################################################
 
 from oriented_matroids.abstract_oriented_matroid import AbstractOrientedMatroid
-from sage.categories.sets_cat import Sets
+from sage.misc.cachefunc import cached_method
+from bisect import bisect_left, bisect_right
 
 
 class VectorOrientedMatroid(AbstractOrientedMatroid):
@@ -49,7 +50,8 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
     INPUT:
 
     - ``data`` -- a tuple containing SignedSubsetElement elements or data
-      that can be used to construct :class:`SignedSubsetElement` elements
+      that can be used to construct :class:`SignedSubsetElement` elements.
+      Repeated signed subsets are only kept once.
     - ``goundset`` -- (default: ``None``) is the groundset for the
       data. If not provided, we grab the data from the signed subsets.
 
@@ -65,6 +67,9 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
         Vector oriented matroid of rank 0
         sage: M.groundset()
         ('e',)
+        sage: M = OrientedMatroid([[1],[-1],[0],[1]], key='vector')
+        sage: len(M.vectors())
+        3
 
 
     .. SEEALSO::
@@ -73,16 +78,6 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
         - :class:`oriented_matroids.abstract_oriented_matroid.AbstractOrientedMatroid`
         - :class:`oriented_matroids.signed_subset_element.SignedSubsetElement`
     """
-    @staticmethod
-    def __classcall__(cls, data, groundset=None, category=None):
-        """
-        Normalize arguments and set class.
-        """
-        if category is None:
-            category = Sets()
-        return super().__classcall__(cls, data, groundset=groundset,
-                                     category=category)
-
     def __init__(self, data, groundset=None, category=None):
         """
         Initialize ``self``.
@@ -104,18 +99,43 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
                 if X.groundset() != groundset:
                     raise ValueError("Groundsets must be the same")
 
-        self._vectors = vectors
-        self._elements = vectors
+        # Drop repeated vectors, keeping the first of each
+        self._vectors = tuple(dict.fromkeys(vectors))
+        self._elements = self._vectors
 
         if groundset is None:
             self._groundset = groundset
         else:
             self._groundset = tuple(groundset)
 
+    @cached_method
+    def _vector_masks(self):
+        r"""
+        Return the positives and negatives of the vectors as bitmasks.
+
+        The `i`-th bit of a mask is set if the `i`-th element of the ground
+        set belongs to the corresponding set.
+
+        OUTPUT:
+
+        A pair of lists of integers, indexed like :meth:`vectors`.
+        """
+        bit = self._groundset_bits()
+        els = self.vectors()
+        pos = [sum(bit[e] for e in X.positives()) for X in els]
+        neg = [sum(bit[e] for e in X.negatives()) for X in els]
+        return pos, neg
+
+    @cached_method
     def is_valid(self) -> bool:
         """
         Return whether our vectors satisfy the vector axioms.
 
+        The axioms are checked in the order opposites, composition,
+        elimination and then the empty set, and a ``ValueError`` is raised
+        for the first one that fails. So a family that breaks several axioms
+        reports the earliest in that order, not the lowest numbered one.
+
         EXAMPLES::
 
             sage: from oriented_matroids.oriented_matroid import OrientedMatroid
@@ -137,46 +157,44 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
             ...
             ValueError: vector elimination failed
 
+        The answer is cached, so checking again is immediate::
+
+            sage: V = [[1,1],[-1,-1],[0,0]]
+            sage: M = OrientedMatroid(V, key='vector')
+            sage: M.is_valid()
+            True
+            sage: M.is_valid.is_in_cache()
+            True
+            sage: M.is_valid()
+            True
+
         """
-        vectors = self.vectors()
-
-        zero_found = False
-        for X in vectors:
-            # Axiom 1: Make sure empty is not present
-            if X.is_zero():
-                zero_found = True
-            # Axiom 2: Make sure negative exists
-            if -X not in vectors:
-                raise ValueError("Every element needs an opposite")
-            for Y in vectors:
-                # Axiom 3: Closed under composition
-                if X.composition(Y) not in vectors:
+        pos, neg = self._vector_masks()
+        signs = set(zip(pos, neg))
+
+        # Axiom 2: Make sure negative exists
+        if any((n, p) not in signs for p, n in signs):
+            raise ValueError("Every element needs an opposite")
+
+        # Axiom 3: Closed under composition
+        for Xp, Xn in zip(pos, neg):
+            Xs = Xp | Xn
+            if not Xs:
+                # `X \circ Y = Y`
+                continue
+            for Yp, Yn in zip(pos, neg):
+                if not (Yp | Yn) & ~Xs:
+                    # `X \circ Y = X`
+                    continue
+                if (Xp | (Yp & ~Xs), Xn | (Yn & ~Xs)) not in signs:
                     raise ValueError("Composition must be in vectors")
-                # Axiom 4: Vector elimination
-                E = X.positives().intersection(Y.negatives())
-
-                ze1 = X.support().difference(Y.support())
-                ze2 = Y.support().difference(X.support())
-                ze3 = X.positives().intersection(Y.positives())
-                ze4 = X.negatives().intersection(Y.negatives())
-                ze = ze1.union(ze2).union(ze3).union(ze4)
-                for e in E:
-                    p = X.positives().union(Y.positives())
-                    p.discard(e)
-                    n = X.negatives().union(Y.negatives())
-                    n.discard(e)
-                    found = False
-                    for Z in vectors:
-                        if found:
-                            break
-                        if Z.positives().issubset(p) \
-                                and Z.negatives().issubset(n) \
-                                and ze.issubset(Z.support()):
-                            found = True
-                    if not found:
-                        raise ValueError("vector elimination failed")
-
-        if not zero_found:
+
+        # Axiom 4: Vector elimination
+        if not _vector_elimination(pos, neg):
+            raise ValueError("vector elimination failed")
+
+        # Axiom 1: Make sure empty is not present
+        if (0, 0) not in signs:
             raise ValueError("Empty set is required")
 
         return True
@@ -199,6 +217,7 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
             rep = "Vector oriented matroid"
         return rep
 
+    @cached_method
     def matroid(self):
         r"""
         Returns the underlying matroid.
@@ -239,11 +258,72 @@ class VectorOrientedMatroid(AbstractOrientedMatroid):
              -: 0
              0: ]
         """
-        if hasattr(self, "_circuits"):
+        try:
             return self._circuits
-        from sage.combinat.posets.posets import Poset
-        # remove 0
-        vecs = [v for v in self.vectors() if not v.is_zero()]
-        P = Poset([vecs, lambda x, y: x.is_restriction_of(y)])
-        self._circuits = P.minimal_elements()
+        except AttributeError:
+            pass
+        vecs = self.vectors()
+        pos, neg = self._vector_masks()
+        # `X` is a restriction of `Y` if and only if the packed masks of
+        # `X` are a submask of those of `Y`.
+        shift = len(self._groundset_bits())
+        packed = [p | (n << shift) for p, n in zip(pos, neg)]
+        # Sweep the nonzero vectors by increasing support size; anything
+        # strictly below a vector has already been seen.
+        order = sorted((k for k in range(len(vecs)) if packed[k]),
+                       key=lambda k: bin(packed[k]).count('1'))
+        minimal = []
+        for k in order:
+            X = packed[k]
+            if not any(not packed[m] & ~X for m in minimal):
+                minimal.append(k)
+        self._circuits = [vecs[k] for k in sorted(minimal)]
         return self._circuits
+
+
+def _vector_elimination(pos, neg):
+    r"""
+    Return whether the vector elimination axiom holds.
+
+    For all `X, Y` and `e \in X^+ \cap Y^-`, there must be a `Z` with
+    `Z^+ \subseteq (X^+ \cup Y^+) \setminus e`,
+    `Z^- \subseteq (X^- \cup Y^-) \setminus e` and whose support contains
+    every `f \neq e` on which `X` and `Y` do not cancel.
+
+    INPUT:
+
+    - ``pos``, ``neg`` -- lists of integers used as bitsets; the positives
+      and negatives of the vectors
+    """
+    # The positives, negatives and support of each vector are kept
+    # together, ordered by the size of the support, smallest first
+    vecs = sorted(((p, n, p | n) for p, n in zip(pos, neg)),
+                  key=lambda v: bin(v[2]).count('1'))
+    sizes = [bin(v[2]).count('1') for v in vecs]
+
+    for Xp, Xn, Xs in vecs:
+        for Yp, Yn, Ys in vecs:
+            E = Xp & Yn
+            if not E:
+                continue
+
+            ze = (Xs ^ Ys) | (Xp & Yp) | (Xn & Yn)
+            p_base = Xp | Yp
+            n_base = Xn | Yn
+            # The support of a witness contains ``ze`` and lies inside
+            # ``p_base | n_base`` minus the eliminated element
+            lo = bisect_left(sizes, bin(ze).count('1'))
+            hi = bisect_right(sizes, bin(p_base | n_base).count('1') - 1)
+            candidates = [(Zp, Zn) for Zp, Zn, Zs in vecs[lo:hi]
+                          if not ze & ~Zs]
+            while E:
+                e = E & -E
+                E ^= e
+                p = p_base & ~e
+                n = n_base & ~e
+                for Zp, Zn in candidates:
+                    if not ((Zp & ~p) | (Zn & ~n)):
+                        break
+                else:
+                    return False
+    return True
@@ -13,7 +13,6 @@ class SageTest(TestCommand):
 
 
 setup(
-    version='0.1.1',
     packages=find_packages(),
     cmdclass={'test': SageTest},  # adding a special setup command for tests
 )